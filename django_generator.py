@@ -14,33 +14,15 @@ Creates a Django project with:
 
 Single-file, GUI kept similar to original.
 """
-import os
 import sys
 import subprocess
-import threading
-import textwrap
-import venv
 from pathlib import Path
 from typing import Optional, Callable, List
-import shutil
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import logging
-from datetime import datetime
-from tkinter.scrolledtext import ScrolledText
 
-__version__ = "1.0.0"
-
-# --- Logging setup ---
-LOG_FILE = Path.home() / ".django_generator.log"
-
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-)
+# Log through the package's logger and rotating log file rather than a second setup.
+from django_generator.helpers import LOG_FILE, log
 
-logging.info(f"--- Django Generator started at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---")
+__version__ = "1.0.0"
 
 # -------------------------
 # Helpers
@@ -49,9 +31,8 @@ def run_command(cmd: List[str], cwd: Optional[str] = None, cb: Optional[Callable
     """Run subprocess command safely (cross-platform) and log output incrementally."""
     try:
         cmd = [str(c) for c in cmd]
-        shell_flag = os.name == "nt"  # needed for Windows PATH resolution
         log(cb, f"→ {' '.join(cmd)}")
-        proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, shell=shell_flag)
+        proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, shell=False)
 
         if proc.stdout:
             for line in proc.stdout.strip().splitlines():
@@ -68,16 +49,6 @@ def run_command(cmd: List[str], cwd: Optional[str] = None, cb: Optional[Callable
         log(cb, f"❌ Error running {' '.join(cmd)}: {e}")
         raise
 
-def log(cb: Optional[Callable], msg: str, level=logging.INFO):
-    """Unified logging helper (writes to file + GUI + console)."""
-    logging.log(level, msg)
-
-    # Send to GUI callback if available
-    if cb:
-        cb(msg)
-    else:
-        print(msg)
-
 """Compatibility shim that exposes the new modular package API.
 
 This file keeps the previous top-level module name (`django_generator.py`) so older
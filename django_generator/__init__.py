@@ -1,8 +1,15 @@
 """Top-level package exports for django_generator.
 
-Expose create_project and the GUI app for backwards compatibility.
+Expose create_project and the GUI app for backwards compatibility. The GUI
+class is resolved lazily so CLI-only use never imports tkinter.
 """
 from .core import create_project
-from .gui_app import DjangoGeneratorApp
 
 __all__ = ["create_project", "DjangoGeneratorApp"]
+
+
+def __getattr__(name):
+    if name == "DjangoGeneratorApp":
+        from .gui_app import DjangoGeneratorApp
+        return DjangoGeneratorApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,21 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Callable
+import os
 import sys
+import threading
 
-from .helpers import log
-from .venv_ops import create_virtualenv, install_django
+from .helpers import log, run_command
+from .venv_ops import create_virtualenv, install_django, prefetch_django
 from .fs_ops import (
-    create_template_structure,
-    patch_settings,
-    create_urls,
-    write_requirements,
+    app_files,
+    copy_bundled_assets,
     init_git,
-    create_gitignore,
-    create_template_structure,
-    create_gitignore,
+    log_settings_patched,
+    render_project_urls,
+    render_settings,
+    template_files,
+    write_files,
+    write_requirements,
 )
 
 
+def _serialized_cb(cb: Optional[Callable]) -> Callable:
+    """Wrap cb (or print) so messages from worker threads don't interleave."""
+    lock = threading.Lock()
+    target = cb or print
+
+    def _cb(msg):
+        with lock:
+            target(msg)
+
+    return _cb
+
+
+def _finalize_project(dest: Path, project_name: str, apps: List[str], create_templates: bool, cb: Optional[Callable] = None) -> None:
+    """Compose settings.py, urls.py, app files and templates in memory, then write each path once."""
+    files = {}
+    settings_path = dest / project_name / "settings.py"
+    unregistered: List[str] = []
+    try:
+        settings_text, unregistered = render_settings(settings_path.read_text(encoding="utf-8"), apps)
+        files[settings_path] = (settings_text, None)
+    except FileNotFoundError:
+        log(cb, f"⚠️ settings.py not found at {settings_path}, skipping patch.")
+
+    if apps:
+        log(cb, "🔗 Creating/patching project urls.py ...")
+        files[dest / project_name / "urls.py"] = (render_project_urls(project_name, apps), None)
+        files.update(app_files(dest, project_name, apps))
+
+    if create_templates:
+        # Bundled assets are copied first so the fallback defaults below never
+        # clobber them (they are only written where nothing exists yet).
+        copy_bundled_assets(dest, cb=cb)
+        files.update(template_files(dest))
+
+    write_files(files)
+    if settings_path in files:
+        log_settings_patched(unregistered, cb=cb)
+    if apps:
+        log(cb, "✅ URLs and app views created (home + app routes).")
+
+
 def create_project(
     destination: str,
     project_name: str,
@@ -35,6 +80,12 @@ def create_project(
 
     python_path = Path(python_exec) if python_exec and Path(python_exec).exists() else None
 
+    # A fresh venv always needs Django downloaded; fetch it while the venv is
+    # built and pip is bootstrapped. install_django waits on it before pip install.
+    prefetch = None
+    if create_venv and not dry_run and not (dest / ".venv").exists():
+        prefetch = prefetch_django(django_version)
+
     if create_venv:
         if dry_run:
             log(cb, f"[dry-run] would create virtualenv at: {dest / '.venv'}")
@@ -50,23 +101,33 @@ def create_project(
         log(cb, f"[dry-run] would install Django ({django_version or 'latest'}) using: {python_path} -m pip install django{('=='+django_version) if django_version else ''}")
         log(cb, f"[dry-run] would run: {python_path} -m django startproject {project_name} . (cwd={dest})")
     else:
-        install_django(python_path, django_version, cb=cb)
+        install_django(
+            python_path, django_version, cb=cb, bootstrap_pip=create_venv,
+            prefetch=prefetch,
+        )
 
         # create project (manage.py lives in dest)
-        from .helpers import run_command
         log(cb, f"🧱 Creating Django project '{project_name}' in {dest} ...")
         run_command([str(python_path), "-m", "django", "startproject", project_name, "."], cwd=str(dest), cb=cb)
 
     # create apps
     if apps:
         manage_py = dest / "manage.py"
-        for app in apps:
-            log(cb, f"📁 Creating app '{app}' ...")
-            if dry_run:
+        if dry_run:
+            for app in apps:
+                log(cb, f"📁 Creating app '{app}' ...")
                 log(cb, f"[dry-run] would run: {python_path} {manage_py} startapp {app} (cwd={dest})")
-            else:
-                from .helpers import run_command
-                run_command([str(python_path), str(manage_py), "startapp", app], cwd=str(dest), cb=cb)
+        else:
+            # startapp runs are independent scaffolds, so run them concurrently;
+            # the threads mostly wait on child interpreters.
+            app_cb = _serialized_cb(cb)
+
+            def _startapp(app: str) -> None:
+                log(app_cb, f"📁 Creating app '{app}' ...")
+                run_command([str(python_path), str(manage_py), "startapp", app], cwd=str(dest), cb=app_cb)
+
+            with ThreadPoolExecutor(max_workers=min(len(apps), os.cpu_count() or 1)) as ex:
+                list(ex.map(_startapp, apps))
 
     # patch settings, templates, urls, requirements, git
     if dry_run:
@@ -75,18 +136,11 @@ def create_project(
             log(cb, f"[dry-run] would create project-level urls and app urls for: {apps}")
         if create_templates:
             log(cb, f"[dry-run] would create templates/static at: {dest / 'templates'} and {dest / 'static'}")
-        log(cb, f"[dry-run] would write requirements.txt (pip freeze) for python: {python_path}")
+        log(cb, f"[dry-run] would write requirements.txt (pinned Django version) for python: {python_path}")
         if init_git_flag:
             log(cb, f"[dry-run] would initialize git in: {dest}")
     else:
-        patch_settings(dest, project_name, apps, cb=cb)
-        if apps:
-            create_urls(dest, project_name, apps, cb=cb)
-        if create_templates:
-            create_template_structure(dest, apps, cb=cb)
-            # sanitize generated templates to ensure {% load static %} present
-            from .fs_ops import sanitize_templates
-            sanitize_templates(dest, cb=cb)
+        _finalize_project(dest, project_name, apps, create_templates, cb=cb)
         write_requirements(python_path, dest, cb=cb)
         if init_git_flag:
             init_git(dest, cb=cb)
@@ -1,243 +1,387 @@
+import os
 import shutil
-import textwrap
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .helpers import log, run_command
+from .venv_ops import django_version
 from . import templates
 
-
-def safe_create_file(path: Path, content: str, overwrite=False):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if path.exists() and not overwrite:
+# Optional assets bundled next to this module; copied in place of the defaults.
+_GENERATOR_ROOT = Path(__file__).resolve().parent
+_SOURCE_TEMPLATES = _GENERATOR_ROOT / "templates"
+_SOURCE_STATIC = _GENERATOR_ROOT / "static"
+
+# Only the multi-line list startproject writes: a line break right after "[" and the
+# closing bracket on its own line. A one-line list never matches, so the lazy body
+# cannot run on into MIDDLEWARE.
+_INSTALLED_APPS_RE = re.compile(
+    r"(^INSTALLED_APPS\s*=\s*\[[ \t]*\n)(.*?)(^[ \t]*\])", re.DOTALL | re.MULTILINE
+)
+_QUOTED_NAME_RE = re.compile(r"['\"]([^'\"]+)['\"]")
+_DIRS_RE = re.compile(r"'DIRS'\s*:\s*\[[^\]]*\]")
+# Anchored to a line start (indentation allowed, e.g. under "if DEBUG:") so a
+# commented-out "# STATIC_URL = ..." is never taken for the setting.
+_STATIC_URL_RE = re.compile(r"^([ \t]*)STATIC_URL\s*=\s*['\"].*?['\"]", re.MULTILINE)
+_STATIC_URL_PRESENT_RE = re.compile(r"^[ \t]*STATIC_URL\s*=", re.MULTILINE)
+_HREF_STATIC_RE = re.compile(r'href="\s*\{%\s*(.*?)\s*%\}\s*"')
+# Cheap pre-check: _HREF_STATIC_RE can only match where href=" is followed by whitespace.
+_HREF_SPACE_RE = re.compile(r'href="\s')
+
+# Project and per-app file bodies for create_urls, filled in with str.format.
+_PROJECT_URLS_PY = """
+from django.contrib import admin
+from django.urls import path, include
+from django.shortcuts import render
+
+def home(request):
+    apps = {apps}
+    return render(request, 'home.html', {{
+        'project_name': '{project_name}',
+        'apps': apps,
+    }})
+
+urlpatterns = [
+    path('', home, name='home'),
+    path('admin/', admin.site.urls),
+{includes}]
+"""
+
+_APP_INDEX_HTML = """
+{{% extends 'base.html' %}}
+{{% block content %}}
+  <div class="card">
+    <h2>{app_title} App</h2>
+    <p>This is the <strong>{app}</strong> app’s default page.</p>
+    <p>Edit <code>templates/{app}/index.html</code> to customize.</p>
+  </div>
+{{% endblock %}}
+"""
+
+_APP_URLS_PY = """
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('', views.index, name='{app}_index'),
+]
+"""
+
+_APP_VIEWS_PY = """
+from django.shortcuts import render
+
+def index(request):
+    apps = {apps}
+    return render(request, '{app}/index.html', {{
+        'app_title': '{app_title}',
+        'apps': apps,
+        'project_name': '{project_name}',
+    }})
+"""
+
+_GITIGNORE = """
+# Python
+__pycache__/
+*.py[cod]
+*.pyo
+*.pyd
+.Python
+env/
+venv/
+.venv/
+build/
+develop-eggs/
+dist/
+downloads/
+eggs/
+.eggs/
+lib/
+lib64/
+parts/
+sdist/
+var/
+*.egg-info/
+.installed.cfg
+*.egg
+
+# Django
+*.log
+local_settings.py
+db.sqlite3
+media/
+
+# VSCode
+.vscode/
+
+# macOS / Windows
+.DS_Store
+Thumbs.db
+"""
+
+
+def safe_create_file(path: Path, content: str, overwrite=False, atomic=False, skip_mkdir=False):
+    """Create path with content; existing files are kept unless overwrite is set.
+
+    Overwriting renames the old file to <name>.bak. With atomic=True the new
+    content is written to a .tmp sibling and swapped in, without a backup.
+    Pass skip_mkdir=True when the caller has already created path.parent.
+    """
+    if not skip_mkdir:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    # Exclusive create doubles as the existence check: one open instead of stat + open.
+    try:
+        with open(path, "x", encoding="utf-8") as f:
+            f.write(content)
         return
-    if path.exists() and overwrite:
-        backup = path.with_suffix(path.suffix + ".bak")
-        shutil.copy2(path, backup)
+    except FileExistsError:
+        if not overwrite:
+            return
+    if atomic:
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(content, encoding="utf-8")
+        os.replace(tmp, path)
+        return
+    os.replace(path, path.with_suffix(path.suffix + ".bak"))
     path.write_text(content, encoding="utf-8")
 
 
-def create_template_structure(repo_root: Path, apps: List[str], cb=None):
-    generator_root = Path(__file__).parent
-    source_templates = generator_root / "templates"
-    source_static = generator_root / "static"
-    dest_templates = repo_root / "templates"
-    dest_static = repo_root / "static"
+def write_files(files: Dict[Path, Tuple[str, Optional[bool]]]):
+    """Write a {path: (content, overwrite)} plan, creating each parent dir once.
+
+    overwrite=None replaces the file outright; True/False behave as in safe_create_file.
+    """
+    for parent in {path.parent for path in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def _write(item):
+        path, (content, overwrite) = item
+        if overwrite is None:
+            safe_create_file(path, content, overwrite=True, atomic=True, skip_mkdir=True)
+        else:
+            safe_create_file(path, content, overwrite=overwrite, skip_mkdir=True)
 
+    # Paths are distinct and their dirs exist, so the small writes can overlap.
+    with ThreadPoolExecutor(max_workers=min(8, len(files) or 1)) as ex:
+        list(ex.map(_write, files.items()))
+
+
+def _has_any(path: Path) -> bool:
+    """True if path is a directory with at least one entry (stops at the first)."""
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+@lru_cache(maxsize=1)
+def _bundled_assets() -> Tuple[Optional[Path], Optional[Path]]:
+    """Return the generator's (templates, static) dirs, or None where missing/empty.
+
+    The bundled assets ship with the package, so the lookup is done once per process.
+    """
+    return (
+        _SOURCE_TEMPLATES if _has_any(_SOURCE_TEMPLATES) else None,
+        _SOURCE_STATIC if _has_any(_SOURCE_STATIC) else None,
+    )
+
+
+def _fast_copytree(src: Path, dst: Path, skip: Tuple[str, ...] = ()):
+    """Mirror src into dst: walk with os.scandir, create dirs, then copy files concurrently.
+
+    Names in skip are left out at the top level only.
+    """
+    pairs = []
+    pending = [(src, dst, skip)]
+    while pending:
+        src_dir, dst_dir, skip_names = pending.pop()
+        dst_dir.mkdir(parents=True, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                if entry.name in skip_names:
+                    continue
+                if entry.is_dir():
+                    pending.append((entry.path, dst_dir / entry.name, ()))
+                else:
+                    pairs.append((entry.path, dst_dir / entry.name))
+
+    # copyfile uses the kernel fast-copy path and skips copy2's metadata work.
+    # Hardlinks would be cheaper still, but later edits to the project files
+    # (sanitize_templates, the user) would then leak back into the generator.
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        list(ex.map(lambda pair: shutil.copyfile(*pair), pairs))
+
+
+def copy_bundled_assets(repo_root: Path, cb=None):
+    """Copy the generator's bundled templates/static into repo_root.
+
+    The top-level templates/base.html is skipped; template_files emits it
+    already sanitized so it is written exactly once.
+    """
     log(cb, f"📂 Copying templates and static assets from generator ...")
+    source_templates, source_static = _bundled_assets()
 
-    if source_templates.exists() and any(source_templates.iterdir()):
-        shutil.copytree(source_templates, dest_templates, dirs_exist_ok=True)
-    else:
-        dest_templates.mkdir(parents=True, exist_ok=True)
-        safe_create_file(dest_templates / "base.html", templates.DEFAULT_BASE_HTML)
-        safe_create_file(dest_templates / "home.html", templates.DEFAULT_HOME_HTML.replace("{{ project_name }}", repo_root.name))
-        safe_create_file(dest_templates / "app_index.html", templates.DEFAULT_APP_INDEX_HTML)
+    if source_templates:
+        _fast_copytree(source_templates, repo_root / "templates", skip=("base.html",))
+    if source_static:
+        _fast_copytree(source_static, repo_root / "static")
 
-    if source_static.exists() and any(source_static.iterdir()):
-        shutil.copytree(source_static, dest_static, dirs_exist_ok=True)
+
+@lru_cache(maxsize=64)
+def _render_home(project_name: str) -> str:
+    return templates.DEFAULT_HOME_HTML.replace("{{ project_name }}", project_name)
+
+
+def template_files(repo_root: Path) -> Dict[Path, Tuple[str, Optional[bool]]]:
+    """Default templates/static for whatever the generator doesn't bundle, plus the sanitized bundled base.html."""
+    source_templates, source_static = _bundled_assets()
+    dest_templates = repo_root / "templates"
+    files = {}
+    if source_templates:
+        bundled_base = source_templates / "base.html"
+        if bundled_base.is_file():
+            files[dest_templates / "base.html"] = (_sanitize_base_html(bundled_base.read_text(encoding="utf-8")), None)
     else:
-        (dest_static / "css").mkdir(parents=True, exist_ok=True)
-        safe_create_file(dest_static / "css" / "style.css", templates.DEFAULT_CSS)
+        files[dest_templates / "base.html"] = (templates.DEFAULT_BASE_HTML, False)
+        files[dest_templates / "home.html"] = (_render_home(repo_root.name), False)
+        files[dest_templates / "app_index.html"] = (templates.DEFAULT_APP_INDEX_HTML, False)
+    if not source_static:
+        files[repo_root / "static" / "css" / "style.css"] = (templates.DEFAULT_CSS, False)
+    return files
 
 
-def patch_settings(repo_root: Path, project_name: str, apps: List[str], cb=None):
-    settings_path = repo_root / project_name / "settings.py"
-    if not settings_path.exists():
-        log(cb, f"⚠️ settings.py not found at {settings_path}, skipping patch.")
-        return
+def create_template_structure(repo_root: Path, apps: List[str], cb=None):
+    copy_bundled_assets(repo_root, cb=cb)
+    write_files(template_files(repo_root))
+
 
-    text = settings_path.read_text(encoding="utf-8")
-    lines = text.splitlines()
-    new_lines = []
-    in_apps = False
-
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith("INSTALLED_APPS"):
-            in_apps = True
-            new_lines.append(line)
-            continue
-        if in_apps:
-            if stripped.startswith("]"):
-                for app in apps:
-                    if f"'{app}'" not in text and f'"{app}"' not in text:
-                        new_lines.append(f"    '{app}',")
-                in_apps = False
-        new_lines.append(line)
-
-    new_text = "\n".join(new_lines)
-
-    if re.search(r"'DIRS'\s*:\s*\[", new_text):
-        new_text = re.sub(r"'DIRS'\s*:\s*\[[^\]]*\]", "'DIRS': [BASE_DIR / 'templates']", new_text)
+def render_settings(text: str, apps: List[str]) -> Tuple[str, List[str]]:
+    """Return settings.py text with apps, templates DIRS and static settings patched in.
+
+    The second item lists the apps that could not be registered because
+    INSTALLED_APPS is not the multi-line list startproject writes.
+    """
+    new_text = text
+    unregistered: List[str] = []
+    m = _INSTALLED_APPS_RE.search(text)
+    if not m:
+        unregistered = list(apps)
+    else:
+        # Parse the existing entries once; splice missing apps before the closing bracket.
+        existing = set(_QUOTED_NAME_RE.findall(m.group(2)))
+        additions = "".join(f"    '{app}',\n" for app in apps if app not in existing)
+        new_text = text[:m.end(2)] + additions + text[m.end(2):]
+
+    if _DIRS_RE.search(new_text):
+        new_text = _DIRS_RE.sub("'DIRS': [BASE_DIR / 'templates']", new_text)
     elif "TEMPLATES" in new_text:
         new_text = new_text.replace(
             "'APP_DIRS': True,",
             "            'DIRS': [BASE_DIR / 'templates'],\n            'APP_DIRS': True,"
         )
 
-    if not re.search(r"STATIC_URL\s*=", new_text):
+    if not _STATIC_URL_PRESENT_RE.search(new_text):
         new_text += "\nSTATIC_URL = '/static/'\n"
-    new_text = re.sub(r"STATIC_URL\s*=\s*['\"].*?['\"]", "STATIC_URL = '/static/'", new_text)
+    # A line-start substring test skips the regex when the value is already canonical.
+    if not new_text.startswith("STATIC_URL = '/static/'") and "\nSTATIC_URL = '/static/'" not in new_text:
+        new_text = _STATIC_URL_RE.sub(r"\1STATIC_URL = '/static/'", new_text, count=1)
     if "STATICFILES_DIRS" not in new_text:
         new_text += "\nSTATICFILES_DIRS = [BASE_DIR / 'static']\n"
+    return new_text, unregistered
 
-    settings_path.write_text(new_text, encoding="utf-8")
-    log(cb, "🧩 settings.py patched cleanly (idempotent, safe).")
 
+def log_settings_patched(unregistered: List[str], cb=None):
+    """Report a render_settings result, warning about apps left out of INSTALLED_APPS."""
+    if unregistered:
+        log(cb, "⚠️ INSTALLED_APPS is not a multi-line list; add these apps by hand: " + ", ".join(unregistered))
+    else:
+        log(cb, "🧩 settings.py patched cleanly (idempotent, safe).")
 
-def create_urls(repo_root: Path, project_name: str, apps: List[str], cb=None):
-    project_urls_path = repo_root / project_name / "urls.py"
-    log(cb, "🔗 Creating/patching project urls.py ...")
 
-    base_urls = textwrap.dedent(f"""
-        from django.contrib import admin
-        from django.urls import path, include
-        from django.shortcuts import render
+def patch_settings(repo_root: Path, project_name: str, apps: List[str], cb=None):
+    settings_path = repo_root / project_name / "settings.py"
+    try:
+        text = settings_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        log(cb, f"⚠️ settings.py not found at {settings_path}, skipping patch.")
+        return
 
-        def home(request):
-            apps = {apps!r}
-            return render(request, 'home.html', {{
-                'project_name': '{project_name}',
-                'apps': apps,
-            }})
+    new_text, unregistered = render_settings(text, apps)
+    settings_path.write_text(new_text, encoding="utf-8")
+    log_settings_patched(unregistered, cb=cb)
 
-        urlpatterns = [
-            path('', home, name='home'),
-            path('admin/', admin.site.urls),
-    """)
 
-    for app in apps:
-        base_urls += f"    path('{app}/', include('{app}.urls'))," + "\n"
-    base_urls += "]\n"
+def render_project_urls(project_name: str, apps: List[str]) -> str:
+    includes = "".join(f"    path('{app}/', include('{app}.urls')),\n" for app in apps)
+    return _PROJECT_URLS_PY.format(project_name=project_name, apps=repr(apps), includes=includes)
 
-    project_urls_path.write_text(base_urls, encoding="utf-8")
 
+def app_files(repo_root: Path, project_name: str, apps: List[str]) -> Dict[Path, Tuple[str, Optional[bool]]]:
+    """Per-app urls.py, views.py and templates/<app>/index.html as a write_files plan."""
+    apps_repr = repr(apps)
+    files = {}
     for app in apps:
         app_dir = repo_root / app
-        app_urls = app_dir / "urls.py"
-        app_views = app_dir / "views.py"
-        app_templates = repo_root / "templates" / app
-        app_templates.mkdir(parents=True, exist_ok=True)
-
-        safe_create_file(
-            app_templates / "index.html",
-            textwrap.dedent(f"""
-                {{% extends 'base.html' %}}
-                {{% block content %}}
-                  <div class="card">
-                    <h2>{app.title()} App</h2>
-                    <p>This is the <strong>{app}</strong> app’s default page.</p>
-                    <p>Edit <code>templates/{app}/index.html</code> to customize.</p>
-                  </div>
-                {{% endblock %}}
-            """),
-            overwrite=False,
+        app_title = app.title()
+        files[repo_root / "templates" / app / "index.html"] = (
+            _APP_INDEX_HTML.format(app=app, app_title=app_title),
+            False,
         )
-
-        safe_create_file(
-            app_urls,
-            textwrap.dedent(f"""
-                from django.urls import path
-                from . import views
-
-                urlpatterns = [
-                    path('', views.index, name='{app}_index'),
-                ]
-            """),
-            overwrite=True,
+        files[app_dir / "urls.py"] = (_APP_URLS_PY.format(app=app), True)
+        files[app_dir / "views.py"] = (
+            _APP_VIEWS_PY.format(app=app, app_title=app_title, apps=apps_repr, project_name=project_name),
+            True,
         )
+    return files
 
-        safe_create_file(
-            app_views,
-            textwrap.dedent(f"""
-                from django.shortcuts import render
-
-                def index(request):
-                    apps = {apps!r}
-                    return render(request, '{app}/index.html', {{
-                        'app_title': '{app.title()}',
-                        'apps': apps,
-                        'project_name': '{project_name}',
-                    }})
-            """),
-            overwrite=True,
-        )
 
+def create_urls(repo_root: Path, project_name: str, apps: List[str], cb=None):
+    log(cb, "🔗 Creating/patching project urls.py ...")
+    files = {repo_root / project_name / "urls.py": (render_project_urls(project_name, apps), None)}
+    files.update(app_files(repo_root, project_name, apps))
+    write_files(files)
     log(cb, "✅ URLs and app views created (home + app routes).")
 
 
 def write_requirements(python_exe: Path, dest: Path, cb=None):
     log(cb, "📝 Writing requirements.txt ...")
+    requirements = dest / "requirements.txt"
+    tmp = requirements.with_suffix(".txt.tmp")
     try:
-        out = run_command([str(python_exe), "-m", "pip", "freeze"], cb=cb)
-        (dest / "requirements.txt").write_text(out, encoding="utf-8")
+        # Pin the freshly installed Django directly; a plain interpreter call
+        # is far cheaper than pip freeze scanning site-packages metadata.
+        tmp.write_text(f"Django=={django_version(python_exe)}\n", encoding="utf-8")
+        os.replace(tmp, requirements)
     except Exception as e:
+        tmp.unlink(missing_ok=True)
         log(cb, f"⚠️ Could not write requirements.txt: {e}")
 
 
 def create_gitignore(dest: Path, cb=None):
-    gitignore_content = textwrap.dedent("""
-        # Python
-        __pycache__/
-        *.py[cod]
-        *.pyo
-        *.pyd
-        .Python
-        env/
-        venv/
-        .venv/
-        build/
-        develop-eggs/
-        dist/
-        downloads/
-        eggs/
-        .eggs/
-        lib/
-        lib64/
-        parts/
-        sdist/
-        var/
-        *.egg-info/
-        .installed.cfg
-        *.egg
-
-        # Django
-        *.log
-        local_settings.py
-        db.sqlite3
-        media/
-
-        # VSCode
-        .vscode/
-
-        # macOS / Windows
-        .DS_Store
-        Thumbs.db
-    """)
-    safe_create_file(dest / ".gitignore", gitignore_content, overwrite=False)
+    safe_create_file(dest / ".gitignore", _GITIGNORE, overwrite=False)
     log(cb, "✅ .gitignore created.")
 
 
+@lru_cache(maxsize=1)
+def _git_executable() -> str:
+    """Absolute path to git, resolved once; falls back to the bare name."""
+    return shutil.which("git") or "git"
+
+
 def init_git(dest: Path, cb=None):
     try:
         create_gitignore(dest, cb=cb)
-        run_command(["git", "init"], cwd=str(dest), cb=cb)
+        run_command([_git_executable(), "init"], cwd=str(dest), cb=cb)
         log(cb, "✅ Git repository initialized with .gitignore.")
     except Exception as e:
         log(cb, f"⚠️ Git initialization failed: {e}")
 
 
-def sanitize_templates(repo_root: Path, cb=None):
-    """Ensure base.html loads the static tag and fix common whitespace issues."""
-    base = repo_root / "templates" / "base.html"
-    if not base.exists():
-        log(cb, f"ℹ️ No base.html found at {base}, skipping sanitize.")
-        return
-    text = base.read_text(encoding="utf-8")
-    changed = False
-
+def _sanitize_base_html(text: str) -> str:
+    """Return base.html text with {% load static %} present and href whitespace fixed."""
     # Insert {% load static %} if missing (place after doctype or at top)
     if "{% load static %}" not in text:
         # Try after doctype
@@ -245,18 +389,30 @@ def sanitize_templates(repo_root: Path, cb=None):
             text = text.replace("<!doctype html>", "<!doctype html>\n{% load static %}", 1)
         else:
             text = "{% load static %}\n" + text
-        changed = True
 
-    # Fix accidental spaces inside href attributes around {% static ... %}
-    new_text = re.sub(r"href=\"\s*\{%(.*?)%\}\s*\"", lambda m: "href=\"{%" + m.group(1).strip() + "%}\"", text)
-    if new_text != text:
-        text = new_text
-        changed = True
+    # Fix accidental spaces inside href attributes around {% static ... %}.
+    # Every match starts with href=" and then "{%" or whitespace; skip the
+    # substitution when neither occurs.
+    if 'href="{%' not in text and not _HREF_SPACE_RE.search(text):
+        return text
+    # The \s* around the group already trim the tag body, so a plain template
+    # replacement works without a Python callback per match.
+    return _HREF_STATIC_RE.sub(r'href="{% \1 %}"', text)
+
 
-    if changed:
+def sanitize_templates(repo_root: Path, cb=None):
+    """Ensure base.html loads the static tag and fix common whitespace issues."""
+    base = repo_root / "templates" / "base.html"
+    if not base.exists():
+        log(cb, f"ℹ️ No base.html found at {base}, skipping sanitize.")
+        return
+    text = base.read_text(encoding="utf-8")
+    new_text = _sanitize_base_html(text)
+
+    if new_text != text:
         backup = base.with_suffix(base.suffix + ".bak")
         shutil.copy2(base, backup)
-        base.write_text(text, encoding="utf-8")
+        base.write_text(new_text, encoding="utf-8")
         log(cb, f"🔧 Sanitized templates/base.html (backup created at {backup}).")
     else:
         log(cb, "ℹ️ templates/base.html looks good; no changes made.")
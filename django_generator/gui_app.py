@@ -1,4 +1,5 @@
 import os
+import queue
 import sys
 import subprocess
 import threading
@@ -18,7 +19,9 @@ class DjangoGeneratorApp(tk.Tk):
         super().__init__()
         self.title(f"Django Project Generator v{__version__}")
         self.geometry("1000x540")
+        self._log_queue = queue.SimpleQueue()
         self._build_ui()
+        self.after(50, self._drain_log_queue)
 
     def _build_ui(self):
         frm = ttk.Frame(self, padding=12)
@@ -79,12 +82,24 @@ class DjangoGeneratorApp(tk.Tk):
             self.path_var.set(folder)
 
     def _append_log(self, msg):
-        def _safe():
+        # Called from worker threads: only enqueue, never touch Tk here.
+        self._log_queue.put(msg)
+
+    def _drain_log_queue(self):
+        # Poll on the Tk main loop so a burst of lines (pip) costs one Text
+        # redraw per 50 ms tick instead of one per line.
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
             self.log.configure(state="normal")
-            self.log.insert("end", msg + "\n")
+            self.log.insert("end", "\n".join(lines) + "\n")
             self.log.see("end")
             self.log.configure(state="disabled")
-        self.after(0, _safe)
+        self.after(50, self._drain_log_queue)
 
     def _on_create(self):
         dest = self.path_var.get().strip()
@@ -159,13 +174,13 @@ class DjangoGeneratorApp(tk.Tk):
                 messagebox.showerror("Error", "manage.py not found. Cannot runserver.")
                 return
 
-            shell_flag = os.name == "nt"
             log(self._append_log, f"🚀 Starting Django development server for {project_name} ...")
 
+            # sys.executable is absolute, so no shell is needed for PATH lookup.
             subprocess.Popen(
                 [sys.executable, str(manage_py), "runserver"],
                 cwd=str(dest),
-                shell=shell_flag
+                shell=False
             )
             messagebox.showinfo("Server Running", "Django development server started.\nCheck your terminal window.")
         except Exception as e:
@@ -1,23 +1,40 @@
 import logging
+import logging.handlers
 import os
 import subprocess
+import threading
 from pathlib import Path
 from typing import Callable, List, Optional
 
-from datetime import datetime
-
 LOG_FILE = Path.home() / ".django_generator.log"
 
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-)
+# Cached logger handle; log() goes through it instead of the module-level logging.log.
+_LOG = logging.getLogger("django_generator")
+
+# The log file handler is attached on the first log() call, not at import.
+_log_handler_attached = False
+_log_handler_lock = threading.Lock()
+
+
+def _attach_log_handler():
+    global _log_handler_attached
+    with _log_handler_lock:
+        if _log_handler_attached:
+            return
+        if not _LOG.handlers:
+            handler = logging.handlers.RotatingFileHandler(LOG_FILE, maxBytes=1_000_000, backupCount=3, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+            _LOG.addHandler(handler)
+            _LOG.setLevel(logging.INFO)
+        _log_handler_attached = True
 
 
 def log(cb: Optional[Callable], msg: str, level=logging.INFO):
     """Unified logging helper (writes to file + callback + stdout)."""
-    logging.log(level, msg)
+    if not _log_handler_attached:
+        _attach_log_handler()
+    if _LOG.isEnabledFor(level):
+        _LOG.log(level, msg)
     if cb:
         try:
             cb(msg)
@@ -30,24 +47,36 @@ def log(cb: Optional[Callable], msg: str, level=logging.INFO):
 def run_command(cmd: List[str], cwd: Optional[str] = None, cb: Optional[Callable] = None) -> str:
     """Run subprocess command safely and log output.
 
-    Note: shell=True is avoided unless on Windows where PATH resolution is trickier.
+    Note: shell=True is avoided unless on Windows with a bare command name, where
+    PATH resolution is trickier; absolute executables are launched directly.
     """
     try:
         cmd = [str(c) for c in cmd]
-        shell_flag = os.name == "nt"
+        shell_flag = os.name == "nt" and not (cmd and os.path.isabs(cmd[0]))
         log(cb, f"→ {' '.join(cmd)}")
-        proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, shell=shell_flag)
-
-        out = proc.stdout or ""
-        err = proc.stderr or ""
-        for line in out.splitlines():
-            if line.strip():
-                log(cb, f"   {line}")
-
-        if proc.returncode != 0:
-            msg = err.strip() or out.strip()
-            log(cb, f"❌ Command failed: {msg}")
-            raise subprocess.CalledProcessError(proc.returncode, cmd, output=out, stderr=err)
+        # Stream merged stdout/stderr so output reaches cb while the child runs.
+        # The with block closes the pipe and, if reading raises, kills and reaps the child.
+        with subprocess.Popen(
+            cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1, shell=shell_flag,
+        ) as proc:
+            out_lines = []
+            try:
+                for line in proc.stdout:
+                    out_lines.append(line)
+                    if line.strip():
+                        log(cb, f"   {line.rstrip()}")
+            except BaseException:
+                proc.kill()
+                raise
+            returncode = proc.wait()
+        out = "".join(out_lines)
+
+        if returncode != 0:
+            # The output was already streamed; repeat only its tail, where the error is.
+            tail = [l.strip() for l in out_lines if l.strip()][-2:]
+            log(cb, f"❌ Command failed (exit status {returncode}): {' | '.join(tail)}")
+            raise subprocess.CalledProcessError(returncode, cmd, output=out)
 
         return out.strip()
     except Exception as e:
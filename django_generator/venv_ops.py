@@ -1,27 +1,116 @@
 from pathlib import Path
 import venv
 import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import Future
 from typing import Optional
 
 from .helpers import run_command, log
 
+# Prints the Django version importable by the interpreter it runs in.
+DJANGO_VERSION_SCRIPT = "import django, sys; sys.stdout.write(django.get_version())"
+
+# Interpreter location inside a venv, relative to its root.
+_VENV_PY_REL = Path("Scripts", "python.exe") if os.name == "nt" else Path("bin", "python")
+
+# Where prefetch_django drops wheels for install_django --find-links.
+DJANGO_CACHE_DIR = Path.home() / ".cache" / "django_generator"
+
+
+def django_version(python_exe: Path) -> str:
+    """Return the Django version importable by python_exe.
+
+    Raises RuntimeError carrying the child's error line when Django cannot be
+    imported, and OSError/SubprocessError when the interpreter cannot be run.
+    """
+    proc = subprocess.run(
+        [str(python_exe), "-c", DJANGO_VERSION_SCRIPT],
+        capture_output=True, text=True, timeout=30,
+    )
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        raise RuntimeError(lines[-1] if lines else f"exit status {proc.returncode}")
+    return proc.stdout.strip()
+
+
+def _django_requirement(version: str) -> str:
+    return f"django=={version}" if version else "django"
+
 
 def create_virtualenv(base_dir: Path, cb=None) -> Path:
     venv_path = base_dir / ".venv"
-    if not venv_path.exists():
-        log(cb, f"⚙️ Creating virtual environment at {venv_path} ...")
-        venv.EnvBuilder(with_pip=True).create(venv_path)
-    else:
+    # mkdir doubles as the existence check; EnvBuilder fills the empty directory.
+    try:
+        venv_path.mkdir()
+    except FileExistsError:
         log(cb, "ℹ️ .venv already exists, skipping creation.")
-    python_exe = venv_path / ("Scripts" if os.name == "nt" else "bin") / ("python.exe" if os.name == "nt" else "python")
-    return python_exe
+    else:
+        log(cb, f"⚙️ Creating virtual environment at {venv_path} ...")
+        # Skip ensurepip here; install_django bootstraps pip only when it has to install.
+        venv.EnvBuilder(with_pip=False, symlinks=(os.name != "nt")).create(venv_path)
+    return venv_path / _VENV_PY_REL
+
+
+def prefetch_django(version: str) -> "Future[bool]":
+    """Download pip, Django and its dependencies into DJANGO_CACHE_DIR in the background.
+
+    Runs with the generator's own interpreter (the one the venv is built from)
+    so the download overlaps venv creation. The future resolves to True when
+    the cache holds everything install_django needs to install offline.
+    """
+    def _download() -> bool:
+        try:
+            proc = subprocess.run(
+                [sys.executable, "-m", "pip", "download", "--quiet",
+                 "--dest", str(DJANGO_CACHE_DIR), "pip", _django_requirement(version)],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return False
+        return proc.returncode == 0
 
+    # A daemon thread, not an executor worker: executor threads are joined at
+    # interpreter exit, so a failed or interrupted run would wait on pip.
+    future: "Future[bool]" = Future()
 
-def install_django(python_exe: Path, version: str, cb=None):
+    def _run():
+        try:
+            future.set_result(_download())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=_run, name="django-prefetch", daemon=True).start()
+    return future
+
+
+def install_django(python_exe: Path, version: str, cb=None, bootstrap_pip: bool = False, prefetch: Optional["Future[bool]"] = None):
     log(cb, "📦 Installing/ensuring Django...")
-    run_command([str(python_exe), "-m", "pip", "install", "--upgrade", "pip"], cb=cb)
-    if version:
-        run_command([str(python_exe), "-m", "pip", "install", f"django=={version}"], cb=cb)
-    else:
-        run_command([str(python_exe), "-m", "pip", "install", "django"], cb=cb)
+    # A one-line import probe is far cheaper than a pip run; skip pip on a match.
+    try:
+        current = django_version(python_exe)
+    except (OSError, RuntimeError, subprocess.SubprocessError):
+        current = ""
+    if current and (not version or current == version):
+        log(cb, f"✅ Django {current} already installed, skipping.")
+        return
+
+    if bootstrap_pip:
+        run_command([str(python_exe), "-m", "ensurepip", "--upgrade", "--default-pip"], cb=cb)
+    # One pip run upgrades pip and installs Django in a single resolver pass.
+    cmd = [str(python_exe), "-m", "pip", "install", "--upgrade"]
+    # Resolve the prefetch only now, so the download overlaps ensurepip.
+    if prefetch is not None:
+        if not prefetch.done():
+            log(cb, "⏳ Waiting for Django download to finish ...")
+        try:
+            prefetched = prefetch.result()
+        except Exception:
+            prefetched = False
+        if prefetched:
+            # pip prefers index candidates over --find-links ones of the same
+            # version, so install strictly from the prefetched wheels.
+            cmd += ["--no-index", "--find-links", str(DJANGO_CACHE_DIR)]
+    run_command(cmd + ["pip", _django_requirement(version)], cb=cb)
     log(cb, "✅ Django ready.")